@@ -1,7 +1,11 @@
+import asyncio
 import logging
 import platform
 import subprocess
 import time
+from collections import deque
+from logging.handlers import QueueHandler
+from pathlib import Path
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -16,6 +20,66 @@
 from framework.tui.widgets.selectable_rich_log import SelectableRichLog
 
 
+class _LibraryLogFilter(logging.Filter):
+    """Drop framework/library records before they reach the TUI log queue."""
+
+    _PREFIXES = ("textual", "LiteLLM", "litellm")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not record.name.startswith(self._PREFIXES)
+
+
+class _LogRingBuffer:
+    """Bounded multi-producer log buffer drained in batches by the TUI.
+
+    ``deque.append`` and ``deque.popleft`` are atomic, so logging threads
+    never contend on a lock when enqueueing. Once full, the oldest records
+    are dropped instead of letting a log storm grow memory without bound.
+    """
+
+    def __init__(self, maxlen: int = 10_000):
+        self._records: deque[logging.LogRecord] = deque(maxlen=maxlen)
+
+    def put_nowait(self, record: logging.LogRecord) -> None:
+        """Enqueue a record (called by ``QueueHandler.enqueue``)."""
+        self._records.append(record)
+
+    def get_batch(self, max_items: int) -> list[logging.LogRecord]:
+        """Pop up to ``max_items`` of the oldest records."""
+        records: list[logging.LogRecord] = []
+        popleft = self._records.popleft
+        try:
+            for _ in range(max_items):
+                records.append(popleft())
+        except IndexError:
+            pass
+        return records
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """QueueHandler that resolves records in place instead of copying them.
+
+    The default ``prepare`` runs the full formatter and copies the record so
+    it can be pickled across processes. The TUI drains records in-process, so
+    this only resolves the message and traceback text eagerly (args are not
+    re-read after the call returns, and traceback frames are released) and
+    enqueues the same record. ``stack_info`` is already a string and is left
+    for LogPane to render alongside ``exc_text``.
+    """
+
+    _formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 class StatusBar(Container):
     """Live status bar showing agent execution state."""
 
@@ -190,6 +254,14 @@ class AdenTUI(App):
         border: tall $accent;
     }
 
+    Screen.screenshot-mode ChatRepl {
+        border-left: none;
+    }
+
+    Screen.screenshot-mode ChatTextArea {
+        border: none;
+    }
+
     StatusBar {
         background: $panel;
         color: $text;
@@ -228,6 +300,8 @@ def __init__(
         self.chat_repl = ChatRepl(runtime, resume_session, resume_checkpoint)
         self.status_bar = StatusBar(graph_id=runtime.graph.id)
         self.is_ready = False
+        self.queue_handler: logging.Handler | None = None
+        self._subscription_id: str | None = None
 
     def open_url(self, url: str, *, new_tab: bool = True) -> None:
         """Override to use native `open` for file:// URLs on macOS."""
@@ -287,12 +361,10 @@ def write_initial_logs():
     def _setup_logging_queue(self) -> None:
         """Setup a thread-safe queue for logs."""
         try:
-            import queue
-            from logging.handlers import QueueHandler
-
-            self.log_queue = queue.Queue()
-            self.queue_handler = QueueHandler(self.log_queue)
+            self.log_queue = _LogRingBuffer()
+            self.queue_handler = _PassthroughQueueHandler(self.log_queue)
             self.queue_handler.setLevel(logging.INFO)
+            self.queue_handler.addFilter(_LibraryLogFilter())
 
             # Get root logger
             root_logger = logging.getLogger()
@@ -316,19 +388,19 @@ def _setup_logging_queue(self) -> None:
         except Exception:
             pass
 
+    # Upper bound on records drained per poll tick so a log burst
+    # cannot starve the event loop; the remainder is picked up next tick.
+    _MAX_LOGS_PER_POLL = 200
+
     def _poll_logs(self) -> None:
         """Poll the log queue and update UI."""
         if not self.is_ready:
             return
 
         try:
-            while not self.log_queue.empty():
-                record = self.log_queue.get_nowait()
-                # Filter out framework/library logs
-                if record.name.startswith(("textual", "LiteLLM", "litellm")):
-                    continue
-
-                self.log_pane.write_python_log(record)
+            records = self.log_queue.get_batch(self._MAX_LOGS_PER_POLL)
+            if records:
+                self.log_pane.write_python_logs(records)
         except Exception:
             pass
 
@@ -352,10 +424,22 @@ def _poll_logs(self) -> None:
         EventType.NODE_INPUT_BLOCKED,
     ]
 
-    _LOG_PANE_EVENTS = frozenset(_EVENT_TYPES) - {
-        EventType.LLM_TEXT_DELTA,
-        EventType.CLIENT_OUTPUT_DELTA,
-    }
+    _TEXT_DELTA_EVENTS = frozenset(
+        {
+            EventType.LLM_TEXT_DELTA,
+            EventType.CLIENT_OUTPUT_DELTA,
+        }
+    )
+
+    _GRAPH_EXECUTION_EVENTS = frozenset(
+        {
+            EventType.EXECUTION_STARTED,
+            EventType.EXECUTION_COMPLETED,
+            EventType.EXECUTION_FAILED,
+        }
+    )
+
+    _LOG_PANE_EVENTS = frozenset(_EVENT_TYPES) - _TEXT_DELTA_EVENTS
 
     async def _init_runtime_connection(self) -> None:
         """Subscribe to runtime events with an async handler."""
@@ -383,7 +467,7 @@ def _route_event(self, event: AgentEvent) -> None:
             et = event.type
 
             # --- Chat REPL events ---
-            if et in (EventType.LLM_TEXT_DELTA, EventType.CLIENT_OUTPUT_DELTA):
+            if et in self._TEXT_DELTA_EVENTS:
                 self.chat_repl.handle_text_delta(
                     event.data.get("content", ""),
                     event.data.get("snapshot", ""),
@@ -409,11 +493,7 @@ def _route_event(self, event: AgentEvent) -> None:
                 )
 
             # --- Graph view events ---
-            if et in (
-                EventType.EXECUTION_STARTED,
-                EventType.EXECUTION_COMPLETED,
-                EventType.EXECUTION_FAILED,
-            ):
+            if et in self._GRAPH_EXECUTION_EVENTS:
                 self.graph_view.update_execution(event)
 
             if et == EventType.NODE_LOOP_STARTED:
@@ -471,21 +551,9 @@ def _route_event(self, event: AgentEvent) -> None:
         except Exception:
             pass
 
-    def save_screenshot(self, filename: str | None = None) -> str:
-        """Save a screenshot of the current screen as SVG (viewable in browsers).
-
-        Args:
-            filename: Optional filename for the screenshot. If None, generates timestamp-based name.
-
-        Returns:
-            Path to the saved SVG file.
-        """
+    def _screenshot_path(self, filename: str | None = None) -> Path:
+        """Resolve the SVG path for a screenshot, generating a timestamped name if needed."""
         from datetime import datetime
-        from pathlib import Path
-
-        # Create screenshots directory
-        screenshots_dir = Path("screenshots")
-        screenshots_dir.mkdir(exist_ok=True)
 
         # Generate filename if not provided
         if filename is None:
@@ -496,37 +564,47 @@ def save_screenshot(self, filename: str | None = None) -> str:
         if not filename.endswith(".svg"):
             filename += ".svg"
 
-        # Full path
-        filepath = screenshots_dir / filename
+        return Path("screenshots") / filename
 
+    def _export_clean_screenshot(self) -> str:
+        """Export the current screen as SVG with decorative borders hidden."""
         # Temporarily hide borders for cleaner screenshot
-        chat_widget = self.query_one(ChatRepl)
-        original_chat_border = chat_widget.styles.border_left
-        chat_widget.styles.border_left = ("none", "transparent")
-
-        # Hide all TextArea widget borders
-        input_widgets = self.query("ChatTextArea")
-        original_input_borders = []
-        for input_widget in input_widgets:
-            original_input_borders.append(input_widget.styles.border)
-            input_widget.styles.border = ("none", "transparent")
-
+        screen = self.screen
+        screen.add_class("screenshot-mode")
         try:
-            # Get SVG data from Textual and save it
-            svg_data = self.export_screenshot()
-            filepath.write_text(svg_data, encoding="utf-8")
+            return self.export_screenshot()
         finally:
-            # Restore the original borders
-            chat_widget.styles.border_left = original_chat_border
-            for i, input_widget in enumerate(input_widgets):
-                input_widget.styles.border = original_input_borders[i]
+            screen.remove_class("screenshot-mode")
+
+    @staticmethod
+    def _write_screenshot(filepath: Path, svg_data: str) -> None:
+        """Write SVG data to disk, creating the screenshots directory if needed."""
+        filepath.parent.mkdir(exist_ok=True)
+        filepath.write_text(svg_data, encoding="utf-8")
+
+    def save_screenshot(self, filename: str | None = None) -> str:
+        """Save a screenshot of the current screen as SVG (viewable in browsers).
+
+        Args:
+            filename: Optional filename for the screenshot. If None, generates timestamp-based name.
 
+        Returns:
+            Path to the saved SVG file.
+        """
+        filepath = self._screenshot_path(filename)
+        self._write_screenshot(filepath, self._export_clean_screenshot())
         return str(filepath)
 
-    def action_screenshot(self) -> None:
-        """Take a screenshot (bound to Ctrl+S)."""
+    async def action_screenshot(self) -> None:
+        """Take a screenshot (bound to Ctrl+S).
+
+        Only the SVG export touches widgets, so it stays on the event loop;
+        the file write runs in a worker thread.
+        """
         try:
-            filepath = self.save_screenshot()
+            filepath = self._screenshot_path()
+            svg_data = self._export_clean_screenshot()
+            await asyncio.to_thread(self._write_screenshot, filepath, svg_data)
             self.notify(
                 f"Screenshot saved: {filepath} (SVG - open in browser)",
                 severity="information",
@@ -595,8 +673,6 @@ async def on_unmount(self) -> None:
         # Cancel any active execution - the executor will catch CancelledError
         # and save current state as paused (no waiting needed!)
         try:
-            import asyncio
-
             chat_repl = self.query_one(ChatRepl)
             if chat_repl._current_exec_id:
                 # Find the stream with this execution
@@ -622,12 +698,12 @@ async def on_unmount(self) -> None:
             pass
 
         try:
-            if hasattr(self, "_subscription_id"):
+            if self._subscription_id is not None:
                 self.runtime.unsubscribe_from_events(self._subscription_id)
         except Exception:
             pass
         try:
-            if hasattr(self, "queue_handler"):
+            if self.queue_handler is not None:
                 logging.getLogger().removeHandler(self.queue_handler)
         except Exception:
             pass
@@ -2,14 +2,28 @@
 Graph/Tree Overview Widget - Displays real agent graph structure.
 """
 
+from collections import deque
+from collections.abc import Callable, Iterable
+
+from rich.errors import MarkupError
+from rich.markup import escape
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Vertical
 
 from framework.runtime.agent_runtime import AgentRuntime
-from framework.runtime.event_bus import EventType
+from framework.runtime.event_bus import AgentEvent, EventType
 from framework.tui.widgets.selectable_rich_log import SelectableRichLog as RichLog
 
 
+def _markup_line(line: str) -> Text:
+    """Parse one display line, falling back to plain text if its markup is invalid."""
+    try:
+        return Text.from_markup(line)
+    except MarkupError:
+        return Text(line)
+
+
 class GraphOverview(Vertical):
     """Widget to display Agent execution graph/tree with real data."""
 
@@ -30,14 +44,39 @@ class GraphOverview(Vertical):
     }
     """
 
+    _MAX_PATH_LENGTH = 256
+    _PATH_FOOTER_LENGTH = 5
+    # Bursts of node events collapse into at most one redraw per interval.
+    _REDRAW_INTERVAL = 0.05
+
     def __init__(self, runtime: AgentRuntime):
         super().__init__()
         self.runtime = runtime
+        # The declared graph is fixed for the session, so resolve its
+        # terminal nodes once instead of on every node line render.
+        self._terminal_nodes = frozenset(runtime.graph.terminal_nodes or ())
         self.active_node: str | None = None
-        self.execution_path: list[str] = []
+        # Visited nodes in order (bounded for long runs), plus a set of every
+        # visited node for O(1) membership checks.
+        self.execution_path: deque[str] = deque(maxlen=self._MAX_PATH_LENGTH)
+        self._path_set: set[str] = set()
+        # Last few visited nodes, as shown in the path footer.
+        self._path_tail: deque[str] = deque(maxlen=self._PATH_FOOTER_LENGTH)
         # Per-node status strings shown next to the node in the graph display.
         # e.g. {"planner": "thinking...", "searcher": "web_search..."}
         self._node_status: dict[str, str] = {}
+        self._display: RichLog | None = None
+        # Rendered graph body (header, node and edge lines) and the index of
+        # each node's line in it, so a status change re-renders one line.
+        self._lines: list[str] = []
+        self._node_line_index: dict[str, int] = {}
+        # Set when the rendered lines change; redraws are coalesced by _flush.
+        self._dirty = False
+        self._execution_handlers: dict[EventType, Callable[[AgentEvent], None]] = {
+            EventType.EXECUTION_STARTED: self._on_execution_started,
+            EventType.EXECUTION_COMPLETED: self._on_execution_completed,
+            EventType.EXECUTION_FAILED: self._on_execution_failed,
+        }
 
     def compose(self) -> ComposeResult:
         # Use RichLog for formatted output
@@ -45,7 +84,10 @@ def compose(self) -> ComposeResult:
 
     def on_mount(self) -> None:
         """Display initial graph structure."""
+        self._display = self.query_one("#graph-display", RichLog)
+        self._build_lines()
         self._display_graph()
+        self.set_interval(self._REDRAW_INTERVAL, self._flush)
 
     def _topo_order(self) -> list[str]:
         """BFS from entry_node following edges."""
@@ -70,10 +112,9 @@ def _topo_order(self) -> list[str]:
 
     def _render_node_line(self, node_id: str) -> str:
         """Render a single node with status symbol and optional status text."""
-        graph = self.runtime.graph
-        is_terminal = node_id in (graph.terminal_nodes or [])
+        is_terminal = node_id in self._terminal_nodes
         is_active = node_id == self.active_node
-        is_done = node_id in self.execution_path and not is_active
+        is_done = node_id in self._path_set and not is_active
         status = self._node_status.get(node_id, "")
 
         if is_active:
@@ -112,55 +153,113 @@ def _render_edges(self, node_id: str) -> list[str]:
             lines.append(f"  {connector}──▶ {edge.target}{cond}")
         return lines
 
-    def _display_graph(self) -> None:
-        """Display the graph as an ASCII DAG with edge connectors."""
-        display = self.query_one("#graph-display", RichLog)
-        display.clear()
-
+    def _build_lines(self) -> None:
+        """Render the full graph body and record where each node's line sits."""
         graph = self.runtime.graph
-        display.write(f"[bold cyan]Agent Graph:[/bold cyan] {graph.id}\n")
+        lines = [f"[bold cyan]Agent Graph:[/bold cyan] {graph.id}\n"]
+        index: dict[str, int] = {}
 
         # Render each node in topological order with edges
-        ordered = self._topo_order()
-        for node_id in ordered:
-            display.write(self._render_node_line(node_id))
-            for edge_line in self._render_edges(node_id):
-                display.write(edge_line)
+        for node_id in self._topo_order():
+            index[node_id] = len(lines)
+            lines.append(self._render_node_line(node_id))
+            lines.extend(self._render_edges(node_id))
+
+        self._lines = lines
+        self._node_line_index = index
+
+    def _refresh_nodes(self, node_ids: Iterable[str | None], *, force: bool = False) -> None:
+        """Re-render the given nodes' lines and mark the display dirty if any changed."""
+        changed = force
+        for node_id in node_ids:
+            idx = self._node_line_index.get(node_id) if node_id else None
+            if idx is None:
+                continue
+            line = self._render_node_line(node_id)
+            if line != self._lines[idx]:
+                self._lines[idx] = line
+                changed = True
+        if changed:
+            self._dirty = True
 
+    def _flush(self) -> None:
+        """Redraw the display if anything changed since the last flush."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        # Runs from a timer rather than the app's guarded event router, so a
+        # rendering error must not propagate and take down the whole TUI.
+        try:
+            self._display_graph()
+        except Exception:
+            pass
+
+    def _display_graph(self) -> None:
+        """Display the graph as an ASCII DAG with edge connectors."""
+        # _display is only set in on_mount; self.is_mounted is still False
+        # there, so it must not gate the initial draw.
+        display = self._display
+        if display is None:
+            return
+
+        lines = self._lines
         # Execution path footer
         if self.execution_path:
-            display.write("")
-            display.write(f"[dim]Path:[/dim] {' → '.join(self.execution_path[-5:])}")
+            lines = [*lines, "", f"[dim]Path:[/dim] {' → '.join(self._path_tail)}"]
+
+        # Parse each line on its own so a bad or unclosed tag in one status
+        # cannot break or restyle the rest of the graph.
+        text = Text("\n").join(_markup_line(line) for line in lines)
+        if display.highlight:
+            text = display.highlighter(text)
+
+        display.clear()
+        display.write(text)
 
     def update_active_node(self, node_id: str) -> None:
         """Update the currently active node."""
+        previous = self.active_node
         self.active_node = node_id
-        if node_id not in self.execution_path:
+        path_changed = node_id not in self._path_set
+        if path_changed:
+            self._path_set.add(node_id)
             self.execution_path.append(node_id)
-        self._display_graph()
+            self._path_tail.append(node_id)
+        self._refresh_nodes((previous, node_id), force=path_changed)
 
-    def update_execution(self, event) -> None:
+    def update_execution(self, event: AgentEvent) -> None:
         """Update the displayed node status based on execution lifecycle events."""
-        if event.type == EventType.EXECUTION_STARTED:
-            self._node_status.clear()
-            self.execution_path.clear()
-            entry_node = event.data.get("entry_node") or (
-                self.runtime.graph.entry_node if self.runtime else None
-            )
-            if entry_node:
-                self.update_active_node(entry_node)
-
-        elif event.type == EventType.EXECUTION_COMPLETED:
-            self.active_node = None
-            self._node_status.clear()
-            self._display_graph()
+        handler = self._execution_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
 
-        elif event.type == EventType.EXECUTION_FAILED:
-            error = event.data.get("error", "Unknown error")
-            if self.active_node:
-                self._node_status[self.active_node] = f"[red]FAILED: {error}[/red]"
-            self.active_node = None
-            self._display_graph()
+    def _on_execution_started(self, event: AgentEvent) -> None:
+        self._node_status.clear()
+        self.execution_path.clear()
+        self._path_set.clear()
+        self._path_tail.clear()
+        entry_node = event.data.get("entry_node") or (
+            self.runtime.graph.entry_node if self.runtime else None
+        )
+        if entry_node:
+            self.active_node = entry_node
+            self._path_set.add(entry_node)
+            self.execution_path.append(entry_node)
+            self._path_tail.append(entry_node)
+        self._refresh_nodes(self._node_line_index, force=True)
+
+    def _on_execution_completed(self, event: AgentEvent) -> None:
+        self.active_node = None
+        self._node_status.clear()
+        self._refresh_nodes(self._node_line_index)
+
+    def _on_execution_failed(self, event: AgentEvent) -> None:
+        error = event.data.get("error", "Unknown error")
+        failed_node = self.active_node
+        if failed_node:
+            self._node_status[failed_node] = f"[red]FAILED: {escape(str(error))}[/red]"
+        self.active_node = None
+        self._refresh_nodes((failed_node,))
 
     # -- Event handlers called by app.py _handle_event --
 
@@ -172,23 +271,23 @@ def handle_node_loop_started(self, node_id: str) -> None:
     def handle_node_loop_iteration(self, node_id: str, iteration: int) -> None:
         """A node advanced to a new loop iteration."""
         self._node_status[node_id] = f"step {iteration}"
-        self._display_graph()
+        self._refresh_nodes((node_id,))
 
     def handle_node_loop_completed(self, node_id: str) -> None:
         """A node's event loop completed."""
         self._node_status.pop(node_id, None)
-        self._display_graph()
+        self._refresh_nodes((node_id,))
 
     def handle_tool_call(self, node_id: str, tool_name: str, *, started: bool) -> None:
         """Show tool activity next to the active node."""
         if started:
-            self._node_status[node_id] = f"{tool_name}..."
+            self._node_status[node_id] = f"{escape(str(tool_name))}..."
         else:
             # Restore to generic thinking status after tool completes
             self._node_status[node_id] = "thinking..."
-        self._display_graph()
+        self._refresh_nodes((node_id,))
 
     def handle_stalled(self, node_id: str, reason: str) -> None:
         """Highlight a stalled node."""
-        self._node_status[node_id] = f"[red]stalled: {reason}[/red]"
-        self._display_graph()
+        self._node_status[node_id] = f"[red]stalled: {escape(str(reason))}[/red]"
+        self._refresh_nodes((node_id,))
@@ -5,6 +5,9 @@
 import logging
 from datetime import datetime
 
+from rich.errors import MarkupError
+from rich.markup import escape
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Container
 
@@ -41,6 +44,10 @@ class LogPane(Container):
         logging.CRITICAL: "bold red",
     }
 
+    # Used only for its traceback formatting; records are otherwise
+    # rendered with LogPane's own markup.
+    _EXC_FORMATTER = logging.Formatter()
+
     DEFAULT_CSS = """
     LogPane {
         width: 100%;
@@ -57,10 +64,17 @@ class LogPane(Container):
     }
     """
 
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._log: RichLog | None = None
+
     def compose(self) -> ComposeResult:
         # RichLog is designed for log display and doesn't have TextArea's rendering issues
         yield RichLog(id="main-log", highlight=True, markup=True, auto_scroll=False)
 
+    def on_mount(self) -> None:
+        self._log = self.query_one("#main-log", RichLog)
+
     def write_event(self, event: AgentEvent) -> None:
         """Format an AgentEvent with timestamp + symbol and write to the log."""
         ts = event.timestamp.strftime("%H:%M:%S")
@@ -112,36 +126,70 @@ def _extract_event_text(self, event: AgentEvent) -> str:
         else:
             return f"{et.value}: {data}"
 
-    def write_python_log(self, record: logging.LogRecord) -> None:
+    def _format_python_log(self, record: logging.LogRecord) -> str:
         """Format a Python log record with timestamp and severity color."""
         ts = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
         color = self._LOG_LEVEL_COLORS.get(record.levelno, "")
         msg = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._EXC_FORMATTER.formatException(record.exc_info)
+        if record.exc_text:
+            msg = f"{msg}\n{record.exc_text}"
+        if record.stack_info:
+            msg = f"{msg}\n{record.stack_info}"
+        # Log text is never markup; escape it so brackets in paths, reprs or
+        # tracebacks cannot break or restyle the line.
+        msg = escape(msg)
         if color:
-            self.write_log(f"[dim]{ts}[/dim] [{color}]{record.levelname}[/{color}] {msg}")
-        else:
-            self.write_log(f"[dim]{ts}[/dim] {record.levelname} {msg}")
+            return f"[dim]{ts}[/dim] [{color}]{record.levelname}[/{color}] {msg}"
+        return f"[dim]{ts}[/dim] {record.levelname} {msg}"
+
+    def write_python_logs(self, records: list[logging.LogRecord]) -> None:
+        """Format a batch of Python log records and write them in one update."""
+        self.write_logs([self._format_python_log(record) for record in records])
+
+    @staticmethod
+    def _write_line(log: RichLog, message: str) -> None:
+        """Write one message, falling back to plain text if its markup is invalid."""
+        try:
+            text = Text.from_markup(message)
+        except MarkupError:
+            text = Text(message)
+        if log.highlight:
+            text = log.highlighter(text)
+        log.write(text)
 
     def write_log(self, message: str) -> None:
         """Write a log message to the log pane."""
-        try:
-            # Check if widget is mounted
-            if not self.is_mounted:
-                return
+        log = self._log
+        if log is None or not log.is_mounted:
+            return
 
-            log = self.query_one("#main-log", RichLog)
+        try:
+            # Only auto-scroll if user is already at the bottom
+            was_at_bottom = log.is_vertical_scroll_end
+            self._write_line(log, message)
+            if was_at_bottom:
+                log.scroll_end(animate=False)
+        except Exception:
+            pass
 
-            # Check if log is mounted
-            if not log.is_mounted:
-                return
+    def write_logs(self, messages: list[str]) -> None:
+        """Write several log messages with a single repaint."""
+        log = self._log
+        if not messages or log is None or not log.is_mounted:
+            return
 
+        try:
             # Only auto-scroll if user is already at the bottom
             was_at_bottom = log.is_vertical_scroll_end
 
-            log.write(message)
+            with self.app.batch_update():
+                for message in messages:
+                    self._write_line(log, message)
 
-            if was_at_bottom:
-                log.scroll_end(animate=False)
+                if was_at_bottom:
+                    log.scroll_end(animate=False)
 
         except Exception:
             pass
@@ -0,0 +1,74 @@
+"""Tests for the TUI log pipeline: QueueHandler -> ring buffer -> LogPane."""
+
+import logging
+
+import pytest
+from textual.app import App, ComposeResult
+
+from framework.tui.app import _LogRingBuffer, _PassthroughQueueHandler
+from framework.tui.widgets.log_pane import LogPane
+
+
+class LogPaneApp(App):
+    def compose(self) -> ComposeResult:
+        yield LogPane()
+
+
+def _rendered_lines(pane: LogPane) -> list[str]:
+    return [line.text for line in pane._log.lines]
+
+
+@pytest.fixture
+def tui_logger():
+    buffer = _LogRingBuffer()
+    handler = _PassthroughQueueHandler(buffer)
+    logger = logging.getLogger("test_tui_log_pane")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger, buffer
+    logger.removeHandler(handler)
+
+
+@pytest.mark.asyncio
+async def test_bad_markup_does_not_drop_rest_of_batch():
+    app = LogPaneApp()
+    async with app.run_test() as pilot:
+        pane = app.query_one(LogPane)
+        pane.write_logs(["one", "bad [/tmp] path", "three", "four"])
+        await pilot.pause()
+
+        assert _rendered_lines(pane) == ["one", "bad [/tmp] path", "three", "four"]
+
+
+@pytest.mark.asyncio
+async def test_exception_with_brackets_renders_with_later_records(tui_logger):
+    logger, buffer = tui_logger
+    try:
+        raise ValueError("cannot open [/tmp/x]")
+    except ValueError:
+        logger.exception("failed [/op]")
+    logger.info("after")
+
+    app = LogPaneApp()
+    async with app.run_test() as pilot:
+        pane = app.query_one(LogPane)
+        pane.write_python_logs(buffer.get_batch(10))
+        await pilot.pause()
+
+        rendered = "\n".join(_rendered_lines(pane))
+        assert "ERROR failed [/op]" in rendered
+        assert "Traceback (most recent call last):" in rendered
+        assert "ValueError: cannot open [/tmp/x]" in rendered
+        assert rendered.splitlines()[-1].endswith("INFO after")
+
+
+def test_handler_formats_args_eagerly(tui_logger):
+    logger, buffer = tui_logger
+    data = {"k": 1}
+    logger.info("dict=%s", data)
+    data["k"] = 2
+
+    (record,) = buffer.get_batch(10)
+    assert record.getMessage() == "dict={'k': 1}"
+    assert record.args is None